@@ -1,7 +1,21 @@
 """Protobuf client for TeraChem server mode"""
 
+import os
 from importlib import metadata
 
+# Prefer the C-accelerated protobuf backend; the pure-Python parser is an
+# order of magnitude slower for the repeated scalar fields in JobOutput.
+# Must be selected before google.protobuf is first imported, and only when
+# the extension actually exists. Users can override by exporting the
+# variable themselves.
+if "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION" not in os.environ:
+    try:
+        from google.protobuf.pyext import _message  # noqa: F401
+
+        os.environ["PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"] = "cpp"
+    except ImportError:
+        pass
+
 from .clients import TCFrontEndClient, TCProtobufClient  # noqa
 
 __version__ = metadata.version(__name__)
@@ -13,19 +13,23 @@ Second 4 bytes: int32 of packet size (not including the header)
 """
 
 import logging
+import os
 import socket
 import struct
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from typing import Dict, List, Optional, Union
 from uuid import uuid4
 
 import httpx
 import numpy as np
-from google.protobuf.json_format import MessageToDict
 from qcio import ProgramInput, ProgramOutput, Provenance
 
 from tcpb.utils import (  # job_output_to_atomic_result,
+    _METHOD_TYPE_VALUES,
+    _RUN_TYPE_VALUES,
+    _UNIT_TYPE_VALUES,
     prog_inp_to_job_inp,
     to_single_point_results,
 )
@@ -37,6 +41,36 @@ from .exceptions import ServerError
 
 logger = logging.getLogger(__name__)
 
+# Valid enum keys resolved once at import; pb.X.keys() walks the descriptor on
+# every call so avoid rebuilding these lists per job submission
+_VALID_RUN_TYPES = frozenset(pb.JobInput.RunType.keys())
+_VALID_UNIT_TYPES = frozenset(pb.Mol.UnitType.keys())
+_VALID_METHOD_TYPES = frozenset(pb.JobInput.MethodType.keys())
+
+# (extras key, JobOutput field name) pairs copied onto results.extras after a
+# compute; precomputed once so job_output_to_atomic_result is a single loop.
+# Empty/default fields are stored as None, matching protobuf's JSON mapping.
+_EXTRAS_REPEATED_FIELDS = (
+    ("charges", "charges"),
+    ("spins", "spins"),
+    ("meyer_bond_order", "bond_order"),
+    ("excited_state_energies", "energy"),
+    ("cis_transition_dipoles", "cis_transition_dipoles"),
+    ("compressed_bond_order", "compressed_bond_order"),
+    ("compressed_hessian", "compressed_hessian"),
+    ("compressed_ao_data", "compressed_ao_data"),
+    ("compressed_primitive_data", "compressed_primitive_data"),
+    ("compressed_mo_vector", "compressed_mo_vector"),
+    ("imd_mmatom_gradient", "imd_mmatom_gradient"),
+)
+_EXTRAS_SCALAR_FIELDS = (
+    ("orb_size", "orb_size"),
+    ("job_dir_scr", "job_scr_dir"),
+    ("server_job_id", "server_job_id"),
+    ("orb1afile", "orb1afile"),
+    ("orb1bfile", "orb1bfile"),
+)
+
 
 class TCProtobufClient:
     """Connect and communicate with a TeraChem instance running in Protocol Buffer server mode
@@ -45,6 +79,24 @@ class TCProtobufClient:
 
     program = "terachem-pbs"
 
+    # Precompiled header codec; reparsing the ">II" format string on every
+    # send/recv adds up in polling loops
+    _header_struct = struct.Struct(">II")
+
+    # Ask the kernel to fill the whole buffer per recv where supported,
+    # collapsing the receive loop to one syscall in the common case. POSIX
+    # only: Windows rejects MSG_WAITALL on sockets in timeout mode, and the
+    # receive loop already handles partial reads without it
+    _recv_flags = getattr(socket, "MSG_WAITALL", 0) if os.name == "posix" else 0
+
+    # MessageType enum -> message constructor for received packets
+    _pb_types = {
+        pb.STATUS: pb.Status,
+        pb.MOL: pb.Mol,
+        pb.JOBINPUT: pb.JobInput,
+        pb.JOBOUTPUT: pb.JobOutput,
+    }
+
     def __init__(
         self,
         host: str = settings.tcpb_host,
@@ -75,6 +127,9 @@ class TCProtobufClient:
         self.tcsock = None
         # Would like to not hard code this, but the truth is I am expecting exactly 8 bytes, not whatever Python thinks 2 ints is
         self.header_size = 8
+        # Reusable receive buffer, grown on demand; recv_into fills it in place
+        # so large JobOutput payloads avoid per-chunk bytes concatenation
+        self._recv_buf = bytearray(65536)
 
         self.prev_results = None
 
@@ -107,6 +162,9 @@ class TCProtobufClient:
         try:
             self.tcsock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.tcsock.settimeout(10.0)  # Timeout of 10 seconds
+            # Headers and small Status messages go out as single small packets;
+            # don't let Nagle's algorithm hold them back waiting for an ACK
+            self.tcsock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.tcsock.connect((self.host, self.port))
         except socket.error as msg:
             raise ServerError(f"Problem connecting to server: {msg}", self)
@@ -118,7 +176,7 @@ class TCProtobufClient:
             return
 
         try:
-            self.tcsock.shutdown(2)  # Shutdown read and write
+            self.tcsock.shutdown(socket.SHUT_RDWR)  # Shutdown read and write
             self.tcsock.close()
             self.tcsock = None
         except socket.error as msg:
@@ -173,8 +231,12 @@ class TCProtobufClient:
                     if retries > 10:
                         raise ServerError("Server is busy and not accepting jobs", self)
                     sleep(0.5)
+            # Exponential backoff: near-zero added latency for fast jobs,
+            # few Status round trips for long ones
+            delay = 0.01
             while not self.check_job_complete():
-                sleep(0.25)
+                sleep(delay)
+                delay = min(2 * delay, 1.0)
             # Collect output from server
             job_output = self._recv_msg(pb.JOBOUTPUT)
         except ServerError as e:
@@ -206,40 +268,29 @@ class TCProtobufClient:
         job_output: pb.JobOutput,
     ) -> ProgramOutput:
         """Convert JobOutput to ProgramOutput"""
-        # Convert job_output to python types
-        # NOTE: Required so that ProgramOutput is JSON serializable. Protobuf types are not.
-        jo_dict = MessageToDict(job_output, preserving_proto_field_name=True)
-
         # Create ProgramOutput
         prog_output: ProgramOutput = ProgramOutput(
             input_data=inp_data,
             success=True,
             provenance=Provenance(
-                program=self.program, scratch_dir=jo_dict.get("job_dir")
+                program=self.program, scratch_dir=job_output.job_dir or None
             ),
             results=to_single_point_results(job_output),
         )
-        # And extend extras to include values additional to input extras
-        prog_output.results.extras.update(
+        # And extend extras to include values additional to input extras.
+        # Read each field once and convert to plain python types so that
+        # ProgramOutput stays JSON serializable; unset fields become None.
+        extras = {
+            key: list(getattr(job_output, field)) or None
+            for key, field in _EXTRAS_REPEATED_FIELDS
+        }
+        extras.update(
             {
-                "charges": jo_dict.get("charges"),
-                "spins": jo_dict.get("spins"),
-                "meyer_bond_order": jo_dict.get("bond_order"),
-                "orb_size": jo_dict.get("orb_size"),
-                "excited_state_energies": jo_dict.get("energy"),
-                "cis_transition_dipoles": jo_dict.get("cis_transition_dipoles"),
-                "compressed_bond_order": jo_dict.get("compressed_bond_order"),
-                "compressed_hessian": jo_dict.get("compressed_hessian"),
-                "compressed_ao_data": jo_dict.get("compressed_ao_data"),
-                "compressed_primitive_data": jo_dict.get("compressed_primitive_data"),
-                "compressed_mo_vector": jo_dict.get("compressed_mo_vector"),
-                "imd_mmatom_gradient": jo_dict.get("imd_mmatom_gradient"),
-                "job_dir_scr": jo_dict.get("job_scr_dir"),
-                "server_job_id": jo_dict.get("server_job_id"),
-                "orb1afile": jo_dict.get("orb1afile"),
-                "orb1bfile": jo_dict.get("orb1bfile"),
+                key: getattr(job_output, field) or None
+                for key, field in _EXTRAS_SCALAR_FIELDS
             }
         )
+        prog_output.results.extras.update(extras)
 
         return prog_output
 
@@ -256,19 +307,21 @@ class TCProtobufClient:
         Returns:
             bool: True on job acceptance, False on server busy, and errors out if communication fails
         """
-        if jobType.upper() not in list(pb.JobInput.RunType.keys()):
+        if jobType.upper() not in _VALID_RUN_TYPES:
             raise ValueError(
                 "Job type specified is not available in this version of the TCPB client\n"
-                "Allowed run types: {}".format(list(pb.JobInput.RunType.keys()))
+                "Allowed run types: {}".format(sorted(_VALID_RUN_TYPES))
             )
         if geom is None:
             raise SyntaxError("Did not provide geometry to send_job_async()")
         if isinstance(geom, np.ndarray):
-            geom = geom.flatten()
-        if unitType.upper() not in list(pb.Mol.UnitType.keys()):
+            # ravel returns a view when geom is already contiguous; flatten
+            # always copies
+            geom = np.ascontiguousarray(geom).ravel()
+        if unitType.upper() not in _VALID_UNIT_TYPES:
             raise ValueError(
                 "Unit type specified is not available in this version of the TCPB client\n"
-                "Allowed unit types: {}".format(list(pb.Mol.UnitType.keys()))
+                "Allowed unit types: {}".format(sorted(_VALID_UNIT_TYPES))
             )
 
         if self.debug:
@@ -301,9 +354,9 @@ class TCProtobufClient:
         Refactored this method out to allow for better testing
         """
         job_input_msg = pb.JobInput()
-        job_input_msg.run = pb.JobInput.RunType.Value(jobType.upper())
-        job_input_msg.mol.xyz.extend(geom)
-        job_input_msg.mol.units = pb.Mol.UnitType.Value(unitType.upper())
+        job_input_msg.run = _RUN_TYPE_VALUES[jobType.upper()]
+        job_input_msg.mol.xyz[:] = geom
+        job_input_msg.mol.units = _UNIT_TYPE_VALUES[unitType.upper()]
 
         self._process_kwargs(job_input_msg, **kwargs)
         return job_input_msg
@@ -327,9 +380,10 @@ class TCProtobufClient:
         # Receive Status
         status = self._recv_msg(pb.STATUS)
 
-        if status.WhichOneof("job_status") == "completed":
+        job_status = status.WhichOneof("job_status")
+        if job_status == "completed":
             return True
-        elif status.WhichOneof("job_status") == "working":
+        elif job_status == "working":
             return False
         else:
             raise ServerError(
@@ -394,23 +448,31 @@ class TCProtobufClient:
         """
         output = self._recv_msg(pb.JOBOUTPUT)
 
+        # Snapshot message fields into locals; each output.<field> access is a
+        # descriptor lookup and several are consulted more than once below
+        mol = output.mol
+        energy = output.energy
+        dipoles = output.dipoles
+        cas_energy_states = output.cas_energy_states
+        cis_states = output.cis_states
+
         # Parse output into normal python dictionary
         results = {
-            "atoms": np.array(output.mol.atoms, dtype="S2"),
-            "geom": np.array(output.mol.xyz, dtype=np.float64).reshape(-1, 3),
+            "atoms": np.fromiter(mol.atoms, dtype="S2", count=len(mol.atoms)),
+            "geom": np.array(mol.xyz, dtype=np.float64).reshape(-1, 3),
             "charges": np.array(output.charges, dtype=np.float64),
             "spins": np.array(output.spins, dtype=np.float64),
-            "dipole_moment": output.dipoles[3],
-            "dipole_vector": np.array(output.dipoles[:3], dtype=np.float64),
+            "dipole_moment": dipoles[3],
+            "dipole_vector": np.array(dipoles[:3], dtype=np.float64),
             "job_dir": output.job_dir,
             "job_scr_dir": output.job_scr_dir,
             "server_job_id": output.server_job_id,
         }
 
-        if len(output.energy):
-            results["energy"] = output.energy[0]
+        if len(energy):
+            results["energy"] = energy[0]
 
-        if output.mol.closed is True:
+        if mol.closed is True:
             results["orbfile"] = output.orb1afile
 
             results["orb_energies"] = np.array(output.orba_energies)
@@ -424,76 +486,72 @@ class TCProtobufClient:
             results["orb_energies_b"] = np.array(output.orbb_energies)
             results["orb_occupations_b"] = np.array(output.orbb_occupations)
 
-        if len(output.gradient):
-            results["gradient"] = np.array(output.gradient, dtype=np.float64).reshape(
-                -1, 3
-            )
+        gradient = output.gradient
+        if len(gradient):
+            results["gradient"] = np.array(gradient, dtype=np.float64).reshape(-1, 3)
 
-        if len(output.nacme):
-            results["nacme"] = np.array(output.nacme, dtype=np.float64).reshape(-1, 3)
+        nacme = output.nacme
+        if len(nacme):
+            results["nacme"] = np.array(nacme, dtype=np.float64).reshape(-1, 3)
 
-        if len(output.cas_transition_dipole):
+        cas_transition_dipole = output.cas_transition_dipole
+        if len(cas_transition_dipole):
             results["cas_transition_dipole"] = np.array(
-                output.cas_transition_dipole, dtype=np.float64
+                cas_transition_dipole, dtype=np.float64
             )
 
-        if len(output.cas_energy_states):
+        if len(cas_energy_states):
             results["energy"] = np.array(
-                output.energy[: len(output.cas_energy_states)], dtype=np.float64
+                energy[: len(cas_energy_states)], dtype=np.float64
             )
             results["cas_energy_labels"] = list(
-                zip(output.cas_energy_states, output.cas_energy_mults)
+                zip(cas_energy_states, output.cas_energy_mults)
             )
 
-        if len(output.bond_order):
-            nAtoms = len(output.mol.atoms)
-            results["bond_order"] = np.array(
-                output.bond_order, dtype=np.float64
-            ).reshape(nAtoms, nAtoms)
-
-        if len(output.ci_overlaps):
-            results["ci_overlap"] = np.array(
-                output.ci_overlaps, dtype=np.float64
-            ).reshape(output.ci_overlap_size, output.ci_overlap_size)
+        bond_order = output.bond_order
+        if len(bond_order):
+            nAtoms = len(mol.atoms)
+            results["bond_order"] = np.array(bond_order, dtype=np.float64).reshape(
+                nAtoms, nAtoms
+            )
 
-        if output.cis_states > 0:
-            results["energy"] = np.array(
-                output.energy[: output.cis_states + 1], dtype=np.float64
+        ci_overlaps = output.ci_overlaps
+        if len(ci_overlaps):
+            results["ci_overlap"] = np.array(ci_overlaps, dtype=np.float64).reshape(
+                output.ci_overlap_size, output.ci_overlap_size
             )
-            results["cis_states"] = output.cis_states
-
-            if len(output.cis_unrelaxed_dipoles):
-                uDips = []
-                for i in range(output.cis_states):
-                    uDips.append(
-                        np.array(
-                            output.cis_unrelaxed_dipoles[4 * i : 4 * i + 3],
-                            dtype=np.float64,
-                        )
-                    )
-                results["cis_unrelaxed_dipoles"] = uDips
-
-            if len(output.cis_relaxed_dipoles):
-                rDips = []
-                for i in range(output.cis_states):
-                    rDips.append(
-                        np.array(
-                            output.cis_relaxed_dipoles[4 * i : 4 * i + 3],
-                            dtype=np.float64,
-                        )
-                    )
-                results["cis_relaxed_dipoles"] = rDips
-
-            if len(output.cis_transition_dipoles):
-                tDips = []
-                for i in range(int((output.cis_states + 1) * output.cis_states / 2)):
-                    tDips.append(
-                        np.array(
-                            output.cis_transition_dipoles[4 * i : 4 * i + 3],
-                            dtype=np.float64,
-                        )
-                    )
-                results["cis_transition_dipoles"] = tDips
+
+        if cis_states > 0:
+            results["energy"] = np.array(energy[: cis_states + 1], dtype=np.float64)
+            results["cis_states"] = cis_states
+
+            cis_unrelaxed_dipoles = output.cis_unrelaxed_dipoles
+            if len(cis_unrelaxed_dipoles):
+                # Each dipole arrives as 4 doubles (x, y, z, |D|); reshape the
+                # flat field once and slice off the vector part rather than
+                # allocating a tiny ndarray per state in a Python loop
+                results["cis_unrelaxed_dipoles"] = list(
+                    np.array(cis_unrelaxed_dipoles, dtype=np.float64).reshape(-1, 4)[
+                        :cis_states, :3
+                    ]
+                )
+
+            cis_relaxed_dipoles = output.cis_relaxed_dipoles
+            if len(cis_relaxed_dipoles):
+                results["cis_relaxed_dipoles"] = list(
+                    np.array(cis_relaxed_dipoles, dtype=np.float64).reshape(-1, 4)[
+                        :cis_states, :3
+                    ]
+                )
+
+            cis_transition_dipoles = output.cis_transition_dipoles
+            if len(cis_transition_dipoles):
+                nPairs = (cis_states + 1) * cis_states // 2
+                results["cis_transition_dipoles"] = list(
+                    np.array(cis_transition_dipoles, dtype=np.float64).reshape(-1, 4)[
+                        :nPairs, :3
+                    ]
+                )
 
         # Save results for user access later
         self.prev_results = results
@@ -528,9 +586,13 @@ class TCProtobufClient:
             sleep(0.5)
             accepted = self.send_job_async(jobType, geom, unitType, **kwargs)
 
+        # Exponential backoff while polling for completion; starts fast for
+        # short jobs and decays to one Status round trip per second
+        delay = 0.01
         completed = self.check_job_complete()
         while completed is False:
-            sleep(0.5)
+            sleep(delay)
+            delay = min(2 * delay, 1.0)
             completed = self.check_job_complete()
 
         return self.recv_job_async()
@@ -580,7 +642,9 @@ class TCProtobufClient:
             tuple: Tuple of (energy, forces), which is really (energy, -gradient)
         """
         results = self.compute_job_sync("gradient", geom, unitType, **kwargs)
-        return results["energy"], -1.0 * results["gradient"]
+        # Negate a copy; the same array object lives in prev_results, which
+        # must keep holding the gradient
+        return results["energy"], -results["gradient"]
 
     def compute_coupling(self, geom=None, unitType="bohr", **kwargs):
         """Compute nonadiabatic coupling of a new geometry, but with the same atoms labels/charge/spin
@@ -721,14 +785,10 @@ class TCProtobufClient:
             elif r == "method":
                 if not isinstance(kwargs["method"], t):
                     raise TypeError("%s must have type: %s" % (r, t))
-                elif kwargs["method"].upper() not in list(
-                    pb.JobInput.MethodType.keys()
-                ):
+                elif kwargs["method"].upper() not in _VALID_METHOD_TYPES:
                     raise ValueError(
                         "Method specified is not available in this version of the TCPB client\n"
-                        "Allowed methods: {}".format(
-                            list(pb.JobInput.MethodType.keys())
-                        )
+                        "Allowed methods: {}".format(sorted(_VALID_METHOD_TYPES))
                     )
             elif not isinstance(kwargs[r], t):
                 raise TypeError("%s must have type: %s" % (r, t))
@@ -745,7 +805,7 @@ class TCProtobufClient:
             elif key == "restricted":
                 job_options.mol.restricted = value
             elif key == "method":
-                job_options.method = pb.JobInput.MethodType.Value(value.upper())
+                job_options.method = _METHOD_TYPE_VALUES[value.upper()]
             elif key == "basis":
                 job_options.basis = value
             elif key == "geom":
@@ -757,8 +817,8 @@ class TCProtobufClient:
                         "Geometry provided to geom does not match atom list"
                     )
 
-                del job_options.mol.xyz[:]
-                job_options.mol.xyz.extend(value)
+                # Slice assignment replaces the contents in one C-level pass
+                job_options.mol.xyz[:] = value
             elif key == "geom2":
                 # Second geometry for ci_vec_overlap job
                 if isinstance(value, np.ndarray):
@@ -768,8 +828,7 @@ class TCProtobufClient:
                         "Geometry provided to geom2 does not match atom list"
                     )
 
-                del job_options.xyz2[:]
-                job_options.xyz2.extend(value)
+                job_options.xyz2[:] = value
             elif key == "bond_order":
                 # Request Meyer bond order matrix
                 if value is not True and value is not False:
@@ -804,64 +863,73 @@ class TCProtobufClient:
         # This will always pack integers as 4 bytes since I am requesting a standard packing (big endian)
         # Big endian is convention for network byte order (because IBM or someone)
         if msg_pb is None:
-            msg_size = 0
+            msg_str = b""
         else:
-            msg_size = msg_pb.ByteSize()
+            msg_str = msg_pb.SerializeToString()
 
-        header = struct.pack(">II", msg_type, msg_size)
+        # Send header + payload as one packet; two sendall calls means two
+        # syscalls and a Nagle-delayed body for every message
+        packet = self._header_struct.pack(msg_type, len(msg_str)) + msg_str
         try:
-            self.tcsock.sendall(header)
+            self.tcsock.sendall(packet)
         except socket.error as msg:
-            raise ServerError("Could not send header: {}".format(msg), self)
-
-        msg_str = b""
-        if msg_pb is not None:
-            try:
-                msg_str = msg_pb.SerializeToString()
-                self.tcsock.sendall(msg_str)
-            except socket.error as msg:
-                raise ServerError("Could not send protobuf: {}".format(msg), self)
+            raise ServerError("Could not send message: {}".format(msg), self)
 
         if self.trace:
-            packet = header + msg_str
             self.outtracefile.write(packet)
 
-    def _recv_msg(self, msg_type):  # noqa NOTE: C901 too complex!
-        """Receives a header + PB from the TeraChem Protobuf server (must be connected)
+    def _recv_exact(self, nbytes, what):
+        """Receive exactly nbytes from the server into the reusable buffer
 
         Args:
-            msg_type: Expected message type (defined as enum in protocol buffer)
+            nbytes: Number of bytes to receive
+            what: Label for error messages (e.g. "header" or "protobuf")
 
         Returns:
-            protobuf: Protocol Buffer of type msg_type (or None if no PB was sent)
+            bytes: The received payload
         """
-        # Receive header
+        if nbytes > len(self._recv_buf):
+            self._recv_buf = bytearray(max(nbytes, 2 * len(self._recv_buf)))
+
+        view = memoryview(self._recv_buf)
+        offset = 0
         try:
-            header = b""
-            nleft = self.header_size
-            while nleft:
-                data = self.tcsock.recv(nleft)
-                if data == b"":
-                    break
-                header += data
-                nleft -= len(data)
-
-            # Check we got full message
-            if nleft == self.header_size and data == b"":
-                raise ServerError(
-                    "Could not recv header because socket was closed from server", self
-                )
-            elif nleft:
-                raise ServerError(
-                    "Recv'd {} of {} expected bytes for header".format(
-                        nleft, self.header_size
-                    ),
-                    self,
+            while offset < nbytes:
+                nrecv = self.tcsock.recv_into(
+                    view[offset:nbytes], nbytes - offset, self._recv_flags
                 )
+                if nrecv == 0:
+                    if offset == 0:
+                        raise ServerError(
+                            "Could not recv {} because socket was closed from server".format(
+                                what
+                            ),
+                            self,
+                        )
+                    raise ServerError(
+                        "Recv'd {} of {} expected bytes for {}".format(
+                            nbytes - offset, nbytes, what
+                        ),
+                        self,
+                    )
+                offset += nrecv
         except socket.error as msg:
-            raise ServerError("Could not recv header: {}".format(msg), self)
+            raise ServerError("Could not recv {}: {}".format(what, msg), self)
+
+        return bytes(view[:nbytes])
+
+    def _recv_msg(self, msg_type):
+        """Receives a header + PB from the TeraChem Protobuf server (must be connected)
+
+        Args:
+            msg_type: Expected message type (defined as enum in protocol buffer)
+
+        Returns:
+            protobuf: Protocol Buffer of type msg_type (or None if no PB was sent)
+        """
+        header = self._recv_exact(self.header_size, "header")
 
-        msg_info = struct.unpack_from(">II", header)
+        msg_info = self._header_struct.unpack(header)
 
         if msg_info[0] != msg_type:
             raise ServerError(
@@ -871,48 +939,20 @@ class TCProtobufClient:
                 self,
             )
 
-        # Receive Protocol Buffer (if one was sent)
-        if msg_info[1] >= 0:
-            try:
-                msg_str = b""
-                nleft = msg_info[1]
-                while nleft:
-                    data = self.tcsock.recv(nleft)
-                    if data == b"":
-                        break
-                    msg_str += data
-                    nleft -= len(data)
-
-                # Check we got full message
-                if nleft == self.header_size and data == b"":
-                    raise ServerError(
-                        "Could not recv message because socket was closed from server",
-                        self,
-                    )
-                elif nleft:
-                    raise ServerError(
-                        "Recv'd {} of {} expected bytes for protobuf".format(
-                            nleft, msg_info[1]
-                        ),
-                        self,
-                    )
-            except socket.error as msg:
-                raise ServerError("Could not recv protobuf: {}".format(msg), self)
-
-        if msg_type == pb.STATUS:
-            recv_pb = pb.Status()
-        elif msg_type == pb.MOL:
-            recv_pb = pb.Mol()
-        elif msg_type == pb.JOBINPUT:
-            recv_pb = pb.JobInput()
-        elif msg_type == pb.JOBOUTPUT:
-            recv_pb = pb.JobOutput()
-        else:
+        try:
+            recv_pb = self._pb_types[msg_type]()
+        except KeyError:
             raise ServerError(
                 "Unknown message type {} for received message.".format(msg_type), self
             )
 
-        recv_pb.ParseFromString(msg_str)
+        # Receive and parse the Protocol Buffer (if one was sent); a
+        # zero-length payload is a default message, no body recv or parse
+        if msg_info[1] > 0:
+            msg_str = self._recv_exact(msg_info[1], "protobuf")
+            recv_pb.ParseFromString(msg_str)
+        else:
+            msg_str = b""
 
         if self.trace:
             packet = header + msg_str
@@ -1104,6 +1144,10 @@ class TCFrontEndClient(TCProtobufClient):
         rm_scratch_dir: bool = True,
     ) -> ProgramOutput:
         """Tasks to be performed after receiving a result from Terachem PBS"""
+        # Bind pydantic attribute chains once; each access re-dispatches
+        # through the model otherwise
+        scratch_dir = prog_output.provenance.scratch_dir
+        guess = prog_output.input_data.keywords.get("guess", "")
 
         # Collect files
         if collect_files:
@@ -1114,25 +1158,28 @@ class TCFrontEndClient(TCProtobufClient):
         # Add stdout
         if collect_stdout or prog_output.success is False:
             try:
-                stdout = self.get(
-                    f"{prog_output.provenance.scratch_dir}/tc.out"
-                ).decode()
+                stdout = self.get(f"{scratch_dir}/tc.out").decode()
             except httpx.HTTPStatusError:
                 stdout = "stdout could not be collected."
 
             po_dict["stdout"] = stdout
 
-        # Delete uploads if not requested to keep
-        if (
-            self.uploads_prefix in prog_output.input_data.keywords.get("guess", "")
-            and rm_scratch_dir
-        ):
-            for path in prog_output.input_data.keywords["guess"].split():
-                self._try_delete(path)
+        # Collect cleanup targets: uploads (if not requested to keep) plus the
+        # scratch directory. The server has no bulk-delete endpoint, so issue
+        # the independent DELETEs concurrently instead of one round-trip each.
+        delete_paths = []
+        if self.uploads_prefix in guess and rm_scratch_dir:
+            delete_paths.extend(guess.split())
 
-        # Delete scratch directory
         if rm_scratch_dir:
-            self._try_delete(f"{prog_output.provenance.scratch_dir}/")
+            delete_paths.append(f"{scratch_dir}/")
+
+        if len(delete_paths) == 1:
+            self._try_delete(delete_paths[0])
+        elif delete_paths:
+            with ThreadPoolExecutor(max_workers=len(delete_paths)) as executor:
+                # Consume the iterator so all deletes finish before returning
+                list(executor.map(self._try_delete, delete_paths))
 
         return prog_output.__class__(**po_dict)
 
@@ -1164,16 +1211,26 @@ class TCFrontEndClient(TCProtobufClient):
                 ]
             )
 
-            for filename in filenames:
-                data: Union[str, bytes]
+            def fetch(filename: str) -> bytes:
                 try:
-                    b_data: bytes = self.get(f"{scr_dir}/{filename}")
+                    return self.get(f"{scr_dir}/{filename}")
                 except httpx.HTTPStatusError:
-                    b_data = f"Could not find file: {filename}".encode()
-                try:
-                    data = b_data.decode()
-                except UnicodeDecodeError:
-                    # File is binary
-                    data = b_data
-
-                prog_output.results.files[filename] = data
+                    return f"Could not find file: {filename}".encode()
+
+            if not filenames:
+                return
+
+            # Downloads are independent and latency-bound; fetch them
+            # concurrently rather than one round-trip at a time
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(filenames))
+            ) as executor:
+                for filename, b_data in zip(filenames, executor.map(fetch, filenames)):
+                    data: Union[str, bytes]
+                    try:
+                        data = b_data.decode()
+                    except UnicodeDecodeError:
+                        # File is binary
+                        data = b_data
+
+                    prog_output.results.files[filename] = data
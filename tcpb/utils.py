@@ -1,62 +1,96 @@
-from copy import deepcopy
+import itertools
 
 import numpy as np
-from google.protobuf.json_format import MessageToDict
 from qcio import ProgramInput, SinglePointResults, Structure, Wavefunction, constants
 
 from . import terachem_server_pb2 as pb
 
 SUPPORTED_CALCTYPES = {"ENERGY", "GRADIENT"}
 
+# Enum name -> value maps resolved once at import; pb.X.Value() walks the enum
+# descriptor on every call so hot conversion paths use these dicts instead
+_RUN_TYPE_VALUES = dict(pb.JobInput.RunType.items())
+_METHOD_TYPE_VALUES = dict(pb.JobInput.MethodType.items())
+_UNIT_TYPE_VALUES = dict(pb.Mol.UnitType.items())
+
+# Keywords with dedicated protobuf fields (or that must be dropped entirely);
+# everything else passes through to user_options
+_JOB_INPUT_KEYWORDS = frozenset(
+    {
+        "charge",
+        "spinmult",
+        "closed_shell",
+        "restricted",
+        "bond_order",
+        "orb1afile",
+        "orb1bfile",
+        "mo_output",
+    }
+)
+
 
 def prog_inp_to_job_inp(prog_inp: ProgramInput) -> pb.JobInput:
     """Convert ProgramInput to JobInput"""
-    # Don't mutate original ProgramInput object
-    pi_copy = deepcopy(prog_inp)
-
-    # Create Mol instance
-    mol_msg = pb.Mol()
-    mol_msg.atoms.extend(pi_copy.structure.symbols)
-    mol_msg.xyz.extend(pi_copy.structure.geometry.flatten())
-    mol_msg.units = pb.Mol.UnitType.BOHR  # Structure always in bohr
-    mol_msg.charge = int(pi_copy.structure.charge)
-    mol_msg.multiplicity = pi_copy.structure.multiplicity
-
-    # Must remove these keywords from the dictionary so they are not passed to JobInput
-    pi_copy.keywords.pop("charge", None)
-    pi_copy.keywords.pop("spinmult", None)
-    mol_msg.closed = pi_copy.keywords.pop("closed_shell", True)
-    mol_msg.restricted = pi_copy.keywords.pop("restricted", True)
-
-    # Create JobInput message
-    ji = pb.JobInput(mol=mol_msg)
-
-    # Set calctype
-    calctype = pi_copy.calctype.upper()
+    # Read-only keyword access; no pops, so the caller's ProgramInput is never
+    # mutated and no defensive deepcopy is needed
+    keywords = prog_inp.keywords
+
+    # Create Mol instance; single constructor call sets all fields in one pass
+    mol_msg = pb.Mol(
+        atoms=prog_inp.structure.symbols,
+        # ravel avoids flatten's unconditional copy and tolist() unboxes the
+        # coordinates in C; handing protobuf an ndarray makes it convert one
+        # np.float64 at a time instead
+        xyz=prog_inp.structure.geometry.ravel().tolist(),
+        units=pb.Mol.UnitType.BOHR,  # Structure always in bohr
+        charge=int(prog_inp.structure.charge),
+        multiplicity=prog_inp.structure.multiplicity,
+        closed=keywords.get("closed_shell", True),
+        restricted=keywords.get("restricted", True),
+    )
+
+    # Validate calctype
+    calctype = prog_inp.calctype.upper()
     if calctype not in SUPPORTED_CALCTYPES:
         raise ValueError(
             f"Calctype '{calctype}' not supported, please select from {SUPPORTED_CALCTYPES}"
         )
-    ji.run = pb.JobInput.RunType.Value(calctype)
-    # Set Method
-    ji.method = pb.JobInput.MethodType.Value(pi_copy.model.method.upper())
-    # Set Basis
-    ji.basis = pi_copy.model.basis or ""
 
-    # Get keywords that have specific protobuf fields
-    ji.return_bond_order = pi_copy.keywords.pop("bond_order", False)
-    ji.orb1afile = pi_copy.keywords.pop("orb1afile", "")
-    ji.orb1bfile = pi_copy.keywords.pop("orb1bfile", "")
+    # Validate method; model.method is free-form user input so a failed
+    # lookup must surface as a descriptive ValueError, not a KeyError
+    try:
+        method = _METHOD_TYPE_VALUES[prog_inp.model.method.upper()]
+    except KeyError:
+        raise ValueError(
+            f"Method '{prog_inp.model.method}' not supported, please select from "
+            f"{sorted(_METHOD_TYPE_VALUES)}"
+        ) from None
 
     # Request AO and MO information
-    if pi_copy.keywords.pop("mo_output", False):
-        ji.imd_orbital_type = pb.JobInput.ImdOrbitalType.WHOLE_C
-
-    # Set all other keywords under the "user_options" catch all
-    for key, value in pi_copy.keywords.items():
-        ji.user_options.extend([key, str(value)])
-
-    return ji
+    if keywords.get("mo_output", False):
+        imd_orbital_type = pb.JobInput.ImdOrbitalType.WHOLE_C
+    else:
+        imd_orbital_type = pb.JobInput.ImdOrbitalType.NO_ORBITAL
+
+    # Create JobInput message; all remaining keywords go under the "user_options"
+    # catch all as a flattened key/value sequence
+    return pb.JobInput(
+        mol=mol_msg,
+        run=_RUN_TYPE_VALUES[calctype],
+        method=method,
+        basis=prog_inp.model.basis or "",
+        return_bond_order=keywords.get("bond_order", False),
+        orb1afile=keywords.get("orb1afile", ""),
+        orb1bfile=keywords.get("orb1bfile", ""),
+        imd_orbital_type=imd_orbital_type,
+        user_options=list(
+            itertools.chain.from_iterable(
+                (key, str(value))
+                for key, value in keywords.items()
+                if key not in _JOB_INPUT_KEYWORDS
+            )
+        ),
+    )
 
 
 def mol_to_structure(mol: pb.Mol) -> Structure:
@@ -67,11 +101,12 @@ def mol_to_structure(mol: pb.Mol) -> Structure:
         object should be a direct superset of the AtomicInput that created it (and
         already contains the Structure submitted by the user)
     """
+    # fromiter preallocates the full array and fills it in one C pass, where
+    # np.array(mol.xyz) first materializes the repeated field as a Python list
+    geom_bohr = np.fromiter(mol.xyz, dtype=np.float64, count=len(mol.xyz))
     if mol.units == pb.Mol.UnitType.ANGSTROM:
-        geom_bohr = np.array(mol.xyz) * constants.ANGSTROM_TO_BOHR
-    elif mol.units == pb.Mol.UnitType.BOHR:
-        geom_bohr = np.array(mol.xyz)
-    else:
+        geom_bohr *= constants.ANGSTROM_TO_BOHR
+    elif mol.units != pb.Mol.UnitType.BOHR:
         raise ValueError(f"Unknown Unit Type: {mol.units} for molecular geometry")
     return Structure(
         symbols=mol.atoms,
@@ -101,10 +136,11 @@ def to_wavefunction_properties(
     job_output: pb.JobOutput,
 ) -> Wavefunction:
     """Extract Wavefunction from JobOutput protobuf message"""
-    jo_dict = MessageToDict(job_output, preserving_proto_field_name=True)
+    # Read the four repeated fields directly rather than paying for a
+    # MessageToDict conversion of the entire JobOutput message
     return Wavefunction(
-        scf_eigenvalues_a=jo_dict.get("orba_energies"),
-        scf_occupations_a=jo_dict.get("orba_occupations"),
-        scf_eigenvalues_b=jo_dict.get("orbb_energies", []),
-        scf_occupations_b=jo_dict.get("orbb_occupations", []),
+        scf_eigenvalues_a=np.asarray(job_output.orba_energies, dtype=np.float64),
+        scf_occupations_a=np.asarray(job_output.orba_occupations, dtype=np.float64),
+        scf_eigenvalues_b=np.asarray(job_output.orbb_energies, dtype=np.float64),
+        scf_occupations_b=np.asarray(job_output.orbb_occupations, dtype=np.float64),
     )
@@ -75,9 +75,29 @@ def prog_output(prog_input):
     return result
 
 
-@pytest.fixture
-def job_output():
-    """Return job_output protobuf message"""
+@pytest.fixture(scope="session")
+def water_bohr_mol():
+    """Parsed water_bohr.pb Mol message; parsed once per session"""
+    mol = pb.Mol()
+    mol.ParseFromString(
+        (Path(__file__).parent / "test_data" / "water_bohr.pb").read_bytes()
+    )
+    return mol
+
+
+@pytest.fixture(scope="session")
+def water_angstrom_mol():
+    """Parsed water_angstrom.pb Mol message; parsed once per session"""
+    mol = pb.Mol()
+    mol.ParseFromString(
+        (Path(__file__).parent / "test_data" / "water_angstrom.pb").read_bytes()
+    )
+    return mol
+
+
+@pytest.fixture(scope="session")
+def _job_output_parsed():
+    """Parse the job_output answer file once per session"""
     job_output_correct_answer = pb.JobOutput()
     with open(
         Path(__file__).parent / "answers" / "cisno_casci_result.pbmsg", "rb"
@@ -86,11 +106,31 @@ def job_output():
     return job_output_correct_answer
 
 
+@pytest.fixture
+def job_output(_job_output_parsed):
+    """Return job_output protobuf message
+
+    Copies the session-scoped parse so tests may mutate their message freely;
+    CopyFrom is much cheaper than re-parsing the serialized file per test.
+    """
+    job_output = pb.JobOutput()
+    job_output.CopyFrom(_job_output_parsed)
+    return job_output
+
+
 def _round(value: Union[Collection[float], float], places: int = 6):
     """Round a value or Collection of values to a set precision"""
     if isinstance(value, (float, int)):
         return round(value, places)
+    elif isinstance(value, np.ndarray):
+        return np.round(value, places).tolist()
     elif isinstance(value, Collection):
+        # Flat numeric sequences round in one vectorized call; only genuinely
+        # nested structures pay for the per-element recursion
+        if isinstance(value, (list, tuple)) and value and isinstance(
+            value[0], (float, int)
+        ):
+            return np.round(np.asarray(value, dtype=np.float64), places).tolist()
         return [_round(v, places) for v in value]
     else:
         raise ValueError(f"Cannot round value of type {type(value)}")
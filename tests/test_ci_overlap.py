@@ -1,15 +1,17 @@
 import os
 
+import numpy as np
+
 from tcpb import TCProtobufClient as TCPBClient
 
 from .answers import ci_overlap
 from .conftest import _round
 
-
-def test_ci_overlap(settings, ethylene):
-    # Ethylene system
-    atoms = ["C", "C", "H", "H", "H", "H"]
-    geom = [
+# Ethylene system; contiguous float64 arrays built once at import so the
+# client skips the per-call list -> ndarray conversion
+atoms = ["C", "C", "H", "H", "H", "H"]
+geom = np.ascontiguousarray(
+    [
         0.35673483,
         -0.05087227,
         -0.47786734,
@@ -28,28 +30,13 @@ def test_ci_overlap(settings, ethylene):
         2.16553127,
         -0.97886933,
         0.15232587,
-    ]
-    geom2 = [
-        0.35673483,
-        -0.05087227,
-        -0.47786734,
-        1.61445821,
-        -0.06684947,
-        -0.02916681,
-        -0.14997206,
-        0.87780529,
-        -0.62680155,
-        -0.16786485,
-        -0.95561368,
-        -0.69426370,
-        2.15270896,
-        0.84221076,
-        0.19314809,
-        2.16553127,
-        -0.97886933,
-        0.15232587,
-    ]
+    ],
+    dtype=np.float64,
+)
+geom2 = geom.copy()
 
+
+def test_ci_overlap(settings, ethylene):
     with TCPBClient(host=settings["tcpb_host"], port=settings["tcpb_port"]) as TC:
         base_options = {
             "atoms": atoms,
@@ -69,19 +69,9 @@ def test_cisno_casci_atomic_input(settings, ethylene, job_output):
         # Add in Ethylene atoms
         results = TC.compute(prog_inp)
 
-    # compare only relevant attributes (computed values)
-    attrs_to_compare = []
-    for attr in dir(results):
-        if (
-            not (
-                attr.startswith("__")
-                or attr.startswith("_")
-                or callable(attr)
-                or attr[0].isupper()
-            )
-            and attr in fields_to_check
-        ):
-            attrs_to_compare.append(attr)
+    # compare only relevant attributes (computed values); iterating the short
+    # fields_to_check list beats filtering every name dir() returns
+    attrs_to_compare = [attr for attr in fields_to_check if hasattr(results, attr)]
 
     for attr in attrs_to_compare:
         if isinstance(getattr(results, attr), RepeatedScalarFieldContainer):
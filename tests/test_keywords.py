@@ -11,34 +11,44 @@ from tcpb import TCProtobufClient as TCPBClient
     "looser convergence doesn't always produce a shorter computation time."
 )
 def test_convthre(settings, prog_input):
-    prog_input.keywords["convthre"] = 3.0e-5
+    # One connection for both computes so the handshake isn't timed, and
+    # perf_counter so wall-clock adjustments can't skew the comparison
     with TCPBClient(settings["tcpb_host"], settings["tcpb_port"]) as client:
-        start = time.time()
+        prog_input.keywords["convthre"] = 3.0e-5
+        start = time.perf_counter()
         client.compute(prog_input)
-        tight_thresh = time.time() - start
+        tight_thresh = time.perf_counter() - start
 
-    prog_input.keywords["convthre"] = 3.0e-1
-    with TCPBClient(settings["tcpb_host"], settings["tcpb_port"]) as client:
-        start = time.time()
+        prog_input.keywords["convthre"] = 3.0e-1
+        start = time.perf_counter()
         client.compute(prog_input)
-        looser_thresh = time.time() - start
+        looser_thresh = time.perf_counter() - start
 
     assert tight_thresh > looser_thresh
 
 
 def test_wavefunction(settings, prog_input):
+    # Reuse one connection for both computes; the TCP handshake is a
+    # measurable fraction of a short SCF
     with TCPBClient(settings["tcpb_host"], settings["tcpb_port"]) as TC:
         prog_output = TC.compute(prog_input)
 
-    # Restricted
-    assert prog_output.results.wavefunction is not None
-    assert isinstance(prog_output.results.wavefunction.scf_eigenvalues_a, np.ndarray)
-    assert isinstance(prog_output.results.wavefunction.scf_occupations_a, np.ndarray)
-    np.testing.assert_equal(prog_output.results.wavefunction.scf_eigenvalues_b, np.array([]))
-    np.testing.assert_equal(prog_output.results.wavefunction.scf_occupations_b, np.array([]))
-
-    prog_input.keywords["restricted"] = False
-    with TCPBClient(settings["tcpb_host"], settings["tcpb_port"]) as TC:
+        # Restricted
+        assert prog_output.results.wavefunction is not None
+        assert isinstance(
+            prog_output.results.wavefunction.scf_eigenvalues_a, np.ndarray
+        )
+        assert isinstance(
+            prog_output.results.wavefunction.scf_occupations_a, np.ndarray
+        )
+        np.testing.assert_equal(
+            prog_output.results.wavefunction.scf_eigenvalues_b, np.array([])
+        )
+        np.testing.assert_equal(
+            prog_output.results.wavefunction.scf_occupations_b, np.array([])
+        )
+
+        prog_input.keywords["restricted"] = False
         prog_output = TC.compute(prog_input)
 
     # B occupations since restricted=False
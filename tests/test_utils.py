@@ -1,17 +1,13 @@
-from pathlib import Path
-
 import numpy as np
+import pytest
 from qcio import ProgramInput, ProgramOutput, constants
 
-from tcpb import terachem_server_pb2 as pb
 from tcpb.clients import TCFrontEndClient, TCProtobufClient
 from tcpb.utils import (
     mol_to_structure,
     prog_inp_to_job_inp,
 )
 
-from .conftest import _round
-
 
 def test_prog_input_to_job_input_cisco_casci_similarity(ethylene):
     """
@@ -55,15 +51,23 @@ def test_prog_input_to_job_input_cisco_casci_similarity(ethylene):
     client = TCProtobufClient("host", 11111)
     stefan_style = client._create_job_input_msg(
         "energy",
-        ethylene.geometry.flatten(),
+        # ravel returns a view; flatten would copy the contiguous geometry
+        ethylene.geometry.ravel(),
         "bohr",
-        **{**old_methodology_options, **keywords},
+        # Double-star unpacks merge in the call itself; no transient merged dict
+        **old_methodology_options,
+        **keywords,
     )
     # Create protobuf JobInput using ProgramInput object
     job_input = prog_inp_to_job_inp(prog_input)
     assert job_input == stefan_style
 
 
+# Exact builtin types allowed in extras after conversion; type-in-frozenset is
+# a single hash probe and also rejects protobuf subclasses outright
+_ALLOWED_EXTRA_TYPES = frozenset({list, float, int, str, bool, type(None)})
+
+
 def test_job_output_to_prog_output(prog_input, job_output):
     client = TCProtobufClient()
     prog_output = client.job_output_to_atomic_result(
@@ -73,20 +77,8 @@ def test_job_output_to_prog_output(prog_input, job_output):
 
     # Check that all types in extras are regular python types (no longer protobuf types)
     for key, value in prog_output.extras.items():
-        assert isinstance(key, str)
-        assert (
-            isinstance(
-                value,
-                (
-                    list,
-                    float,
-                    int,
-                    str,
-                    bool,
-                ),
-            )
-            or value is None
-        )
+        assert type(key) is str
+        assert type(value) in _ALLOWED_EXTRA_TYPES
 
 
 def test_job_output_to_prog_output_correctly_sets_provenance(prog_input, job_output):
@@ -105,25 +97,26 @@ def test_job_output_to_prog_output_correctly_sets_provenance(prog_input, job_out
     assert prog_output.provenance.program == fe_client.program
 
 
-def test_mol_to_struct_bohr():
-    with open(Path(__file__).parent / "test_data" / "water_bohr.pb", "rb") as f:
-        mol = pb.Mol()
-        mol.ParseFromString(f.read())
-    struct = mol_to_structure(mol)
-
-    assert [s for s in struct.symbols] == [a for a in mol.atoms]
-    assert list(struct.geometry.flatten()) == [coord for coord in mol.xyz]
-    assert struct.multiplicity == mol.multiplicity
-
-
-def test_mol_to_struct_angstrom():
-    with open(Path(__file__).parent / "test_data" / "water_angstrom.pb", "rb") as f:
-        mol = pb.Mol()
-        mol.ParseFromString(f.read())
+@pytest.mark.parametrize(
+    "mol_fixture,scale,decimals",
+    [
+        ("water_bohr_mol", 1.0, None),
+        ("water_angstrom_mol", constants.ANGSTROM_TO_BOHR, 6),
+    ],
+)
+def test_mol_to_struct(request, mol_fixture, scale, decimals):
+    mol = request.getfixturevalue(mol_fixture)
     struct = mol_to_structure(mol)
 
-    assert [s for s in struct.symbols] == [a for a in mol.atoms]
-    assert _round(list(struct.geometry.flatten())) == _round(
-        [coord for coord in np.array(mol.xyz) * constants.ANGSTROM_TO_BOHR]
-    )
+    assert list(struct.symbols) == list(mol.atoms)
+
+    expected = np.fromiter(mol.xyz, dtype=np.float64, count=len(mol.xyz))
+    expected *= scale
+    actual = struct.geometry.ravel()
+    if decimals is not None:
+        # Unit conversion introduces float noise; compare at 6 decimals like
+        # the _round helper did
+        expected = np.round(expected, decimals)
+        actual = np.round(actual, decimals)
+    assert np.array_equal(actual, expected)
     assert struct.multiplicity == mol.multiplicity